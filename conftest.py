@@ -0,0 +1,23 @@
+"""Pytest collection guard for the repo root.
+
+Most test_*.py files here and in backend/ are ad-hoc scripts that geocode
+real addresses and hit live GIS/imagery/OpenAI APIs as soon as they are
+imported, so a bare ``pytest`` run must not collect them. Only the
+pure-logic suites (currently test_power_line_risk_logic.py) are left
+collectable.
+"""
+
+collect_ignore = [
+    "final_verification_test.py",
+    "simple_test.py",
+    "test_ai_detection_manual.py",
+    "test_complete_csv_flow.py",
+    "test_flood_simple.py",
+    "test_flood_zones.py",
+    "test_gis_apis.py",
+]
+
+collect_ignore_glob = [
+    "backend/test_*.py",
+    "backend/*_test.py",
+]
@@ -5,25 +5,94 @@ Generate a professional PDF report for the client showing all completed features
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
+from reportlab.platypus import BaseDocTemplate, PageTemplate, Frame, Table, TableStyle, Paragraph, Spacer, PageBreak, Image, Flowable
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.lib.units import inch
 from reportlab.pdfgen import canvas
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
 from datetime import datetime
 import os
+import sys
+
+# Color palette parsed once at import; HexColor re-parses the string and
+# allocates a new Color object on every call, so inline usage repeats that
+# ~40 times per report build. Names follow the Tailwind shades the UI uses.
+PALETTE = {
+    'indigo': colors.HexColor('#4F46E5'),
+    'indigo-50': colors.HexColor('#EEF2FF'),
+    'blue-100': colors.HexColor('#DBEAFE'),
+    'blue-800': colors.HexColor('#1E40AF'),
+    'violet-200': colors.HexColor('#DDD6FE'),
+    'violet-800': colors.HexColor('#5B21B6'),
+    'emerald': colors.HexColor('#10B981'),
+    'emerald-100': colors.HexColor('#D1FAE5'),
+    'emerald-600': colors.HexColor('#059669'),
+    'emerald-800': colors.HexColor('#065F46'),
+    'amber-100': colors.HexColor('#FEF3C7'),
+    'amber-500': colors.HexColor('#F59E0B'),
+    'amber-800': colors.HexColor('#92400E'),
+    'gray-50': colors.HexColor('#F9FAFB'),
+    'gray-100': colors.HexColor('#F3F4F6'),
+    'gray-200': colors.HexColor('#E5E7EB'),
+    'gray-300': colors.HexColor('#D1D5DB'),
+    'gray-500': colors.HexColor('#6B7280'),
+    'gray-700': colors.HexColor('#374151'),
+    'gray-800': colors.HexColor('#1F2937'),
+}
+
+class PlainLine(Flowable):
+    """Single plain-text line drawn straight onto the canvas.
+
+    Bypasses Paragraph's inline-XML parser and line-break algorithm for
+    bullet/checkmark lines that carry no markup; wrap() returns a width
+    measured once at construction.
+    """
+
+    def __init__(self, text, style):
+        Flowable.__init__(self)
+        self.text = text
+        self.style = style
+        self._size = (
+            stringWidth(text, style.fontName, style.fontSize) + style.leftIndent,
+            style.fontSize + style.spaceAfter + 2,
+        )
+
+    def wrap(self, availWidth, availHeight):
+        return (min(self._size[0], availWidth), self._size[1])
+
+    def draw(self):
+        self.canv.setFont(self.style.fontName, self.style.fontSize)
+        self.canv.setFillColor(self.style.textColor)
+        self.canv.drawString(self.style.leftIndent, self.style.spaceAfter, self.text)
+
+
+def feature_line(text, style):
+    """Return the cheapest flowable able to render this line.
+
+    Lines containing inline tags (<b>, <font>, ...) still need the full
+    Paragraph pipeline; everything else gets the direct-draw PlainLine.
+    """
+    if '<' in text:
+        return Paragraph(text, style)
+    return PlainLine(text, style)
+
 
 def create_client_report():
     """Create a beautiful professional PDF report for the client."""
 
-    # Create PDF
+    # Create PDF. BaseDocTemplate with one explicit frame skips
+    # SimpleDocTemplate's first/later-page template machinery; this report has
+    # no TOC or page numbering, so a single one-pass build is all it needs.
     filename = "Property_Analysis_System_Delivery_Report.pdf"
-    doc = SimpleDocTemplate(filename, pagesize=letter,
+    # Hand the doc a 1MB-buffered file object so flowable serialization
+    # coalesces into a few large write() calls instead of many small ones
+    pdf_file = open(filename, 'wb', buffering=1 << 20)
+    doc = BaseDocTemplate(pdf_file, pagesize=letter,
                           rightMargin=50, leftMargin=50,
                           topMargin=50, bottomMargin=50)
-
-    # Container for the 'Flowable' objects
-    elements = []
+    frame = Frame(doc.leftMargin, doc.bottomMargin, doc.width, doc.height, id='body')
+    doc.addPageTemplates([PageTemplate(id='report', frames=[frame])])
 
     # Define custom styles
     styles = getSampleStyleSheet()
@@ -33,7 +102,7 @@ def create_client_report():
         'CustomTitle',
         parent=styles['Heading1'],
         fontSize=28,
-        textColor=colors.HexColor('#4F46E5'),
+        textColor=PALETTE['indigo'],
         spaceAfter=30,
         alignment=TA_CENTER,
         fontName='Helvetica-Bold'
@@ -44,8 +113,8 @@ def create_client_report():
         'CustomSubtitle',
         parent=styles['Heading2'],
         fontSize=16,
-        textColor=colors.HexColor('#6B7280'),
-        spaceAfter=20,
+        textColor=PALETTE['gray-500'],
+        spaceAfter=56,  # includes the pre-badge gap formerly a Spacer
         alignment=TA_CENTER,
         fontName='Helvetica'
     )
@@ -55,8 +124,8 @@ def create_client_report():
         'CustomHeading',
         parent=styles['Heading2'],
         fontSize=18,
-        textColor=colors.HexColor('#1F2937'),
-        spaceAfter=12,
+        textColor=PALETTE['gray-800'],
+        spaceAfter=24,  # headings were all followed by a ~0.15-0.2in Spacer
         spaceBefore=12,
         fontName='Helvetica-Bold'
     )
@@ -66,8 +135,8 @@ def create_client_report():
         'CustomBody',
         parent=styles['BodyText'],
         fontSize=11,
-        textColor=colors.HexColor('#374151'),
-        spaceAfter=12,
+        textColor=PALETTE['gray-700'],
+        spaceAfter=24,  # body paragraphs were all followed by a Spacer
         alignment=TA_JUSTIFY,
         fontName='Helvetica'
     )
@@ -77,561 +146,581 @@ def create_client_report():
         'FeatureStyle',
         parent=styles['BodyText'],
         fontSize=10,
-        textColor=colors.HexColor('#374151'),
+        textColor=PALETTE['gray-700'],
         leftIndent=20,
         spaceAfter=6,
         fontName='Helvetica'
     )
 
-    # ============================================================
-    # PAGE 1: COVER PAGE
-    # ============================================================
-
-    # Title
-    elements.append(Spacer(1, 1.5*inch))
-    elements.append(Paragraph("Property Analysis System", title_style))
-    elements.append(Paragraph("Project Delivery Report", subtitle_style))
-
-    elements.append(Spacer(1, 0.5*inch))
-
-    # Status badge (using table)
-    status_data = [['✅ PRODUCTION READY']]
-    status_table = Table(status_data, colWidths=[4*inch])
-    status_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#10B981')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 16),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-        ('TOPPADDING', (0, 0), (-1, -1), 12),
-        ('GRID', (0, 0), (-1, -1), 2, colors.HexColor('#059669')),
-    ]))
-    elements.append(status_table)
-
-    elements.append(Spacer(1, 0.8*inch))
-
-    # Project info
-    project_info = [
-        ['Project:', 'AI-Powered Property Analysis Platform'],
-        ['Delivery Date:', datetime.now().strftime('%B %d, %Y')],
-        ['Status:', 'Complete & Tested'],
-        ['Version:', '1.0 - Production Ready'],
-    ]
-
-    info_table = Table(project_info, colWidths=[1.5*inch, 4*inch])
-    info_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#F3F4F6')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#1F2937')),
-        ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#E5E7EB')),
-    ]))
-    elements.append(info_table)
-
-    elements.append(PageBreak())
-
-    # ============================================================
-    # PAGE 2: EXECUTIVE SUMMARY
-    # ============================================================
-
-    elements.append(Paragraph("Executive Summary", heading_style))
-    elements.append(Spacer(1, 0.2*inch))
-
-    summary_text = """
-    Your AI-powered property analysis system is now <b>complete and ready for production use</b>.
-    All core features have been implemented, tested, and verified to work correctly. The system
-    includes advanced AI imagery analysis, automated risk assessment, and skip tracing capabilities
-    (pending API key activation).
-    """
-    elements.append(Paragraph(summary_text, body_style))
-    elements.append(Spacer(1, 0.2*inch))
-
-    # Key highlights
-    elements.append(Paragraph("Key Highlights:", heading_style))
-
-    highlights_data = [
-        ['✅', 'AI-Powered Analysis', 'Computer vision analysis of property imagery'],
-        ['✅', 'Risk Assessment', 'Automated GIS-based risk scoring (FREE)'],
-        ['✅', 'Skip Tracing Ready', 'Owner lookup system (needs API key)'],
-        ['✅', 'Smart Filtering', 'Built-in workflow focuses on quality properties'],
-        ['✅', 'Premium UI/UX', 'Professional gradient design for paid features'],
-        ['✅', 'Export Functionality', 'Complete CSV export with all data'],
-    ]
-
-    highlights_table = Table(highlights_data, colWidths=[0.4*inch, 1.8*inch, 3.8*inch])
-    highlights_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#F9FAFB')),
-        ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#10B981')),
-        ('TEXTCOLOR', (1, 0), (-1, -1), colors.HexColor('#1F2937')),
-        ('ALIGN', (0, 0), (0, -1), 'CENTER'),
-        ('ALIGN', (1, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (1, 0), (1, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (2, 0), (2, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#E5E7EB')),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
-    elements.append(highlights_table)
-
-    elements.append(PageBreak())
-
-    # ============================================================
-    # PAGE 3: FEATURES IMPLEMENTED
-    # ============================================================
-
-    elements.append(Paragraph("Features Implemented", heading_style))
-    elements.append(Spacer(1, 0.15*inch))
-
-    # FREE Features
-    elements.append(Paragraph("FREE Features (No Cost Per Use)", ParagraphStyle(
-        'SectionHead',
-        parent=styles['Heading3'],
-        fontSize=14,
-        textColor=colors.HexColor('#059669'),
-        spaceAfter=10,
-        fontName='Helvetica-Bold'
-    )))
-
-    free_features = [
-        'CSV Upload - Support for large property lists',
-        'Address Geocoding - Automatic latitude/longitude conversion',
-        'GIS Risk Analysis - Wetlands, flood zones, slope analysis',
-        'Road Access Detection - Identifies property accessibility',
-        'Protected Land Checks - Conservation areas, parks, etc.',
-        'Utility Detection - Water and sewer availability',
-        'Legal Descriptions - Complete property descriptions',
-        'Risk Filtering - Filter by HIGH/MEDIUM/LOW risk levels',
-        'County/Zip Filtering - Target specific geographical areas',
-        'CSV Export - Download all results with complete data',
-    ]
-
-    for feature in free_features:
-        elements.append(Paragraph(f"• {feature}", feature_style))
-
-    elements.append(Spacer(1, 0.2*inch))
-
-    # PAID Features
-    elements.append(Paragraph("PAID Features (Run Only on Filtered Properties)", ParagraphStyle(
-        'SectionHead',
-        parent=styles['Heading3'],
-        fontSize=14,
-        textColor=colors.HexColor('#4F46E5'),
-        spaceAfter=10,
-        fontName='Helvetica-Bold'
-    )))
-
-    paid_features = [
-        '<b>AI Imagery Analysis</b> (~$0.01-0.03 per property)',
-        '  - Road condition detection (PAVED/DIRT/GRAVEL/POOR)',
-        '  - Power line detection with distance estimation',
-        '  - Development classification (RESIDENTIAL/COMMERCIAL/etc.)',
-        '  - Confidence scores for all AI detections',
-        '  - Google Street View integration',
-        '',
-        '<b>Skip Tracing</b> (~$0.009 per property with Tracerfy)',
-        '  - Owner full name (first, middle, last)',
-        '  - Up to 3 phone numbers (primary, mobile, secondary)',
-        '  - Up to 2 email addresses',
-        '  - Complete mailing address',
-        '  - Owner type and occupancy status',
-        '  - 70-97% accuracy rate',
-    ]
-
-    for feature in paid_features:
-        elements.append(Paragraph(f"• {feature}", feature_style))
-
-    elements.append(PageBreak())
-
-    # ============================================================
-    # PAGE 4: SMART FILTERING WORKFLOW
-    # ============================================================
-
-    elements.append(Paragraph("Smart Filtering Workflow", heading_style))
-    elements.append(Spacer(1, 0.15*inch))
-
-    cost_text = """
-    The system includes a <b>built-in smart filtering workflow</b> that helps you identify
-    the best properties before running paid analysis. This intelligent approach focuses your
-    resources on high-quality opportunities.
-    """
-    elements.append(Paragraph(cost_text, body_style))
-    elements.append(Spacer(1, 0.2*inch))
-
-    # Workflow steps
-    elements.append(Paragraph("How It Works:", ParagraphStyle(
-        'SectionHead',
-        parent=styles['Heading3'],
-        fontSize=13,
-        textColor=colors.HexColor('#1F2937'),
-        spaceAfter=10,
-        fontName='Helvetica-Bold'
-    )))
-
-    workflow_steps = [
-        ['Step 1', 'Upload all properties → Automatic FREE risk analysis'],
-        ['Step 2', 'Filter to LOW/MEDIUM risk only → Focus on quality'],
-        ['Step 3', 'Run AI Analysis → Only on filtered properties'],
-        ['Step 4', 'Run Skip Trace → Only on filtered properties'],
-        ['Result', 'Complete analysis with maximum efficiency'],
-    ]
-
-    workflow_table = Table(workflow_steps, colWidths=[0.9*inch, 5.2*inch])
-    workflow_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, 3), colors.HexColor('#EEF2FF')),
-        ('BACKGROUND', (1, 0), (1, 3), colors.HexColor('#F9FAFB')),
-        ('BACKGROUND', (0, 4), (0, 4), colors.HexColor('#10B981')),
-        ('BACKGROUND', (1, 4), (1, 4), colors.HexColor('#D1FAE5')),
-        ('TEXTCOLOR', (0, 0), (-1, 3), colors.HexColor('#1F2937')),
-        ('TEXTCOLOR', (0, 4), (0, 4), colors.white),
-        ('TEXTCOLOR', (1, 4), (1, 4), colors.HexColor('#065F46')),
-        ('ALIGN', (0, 0), (0, -1), 'CENTER'),
-        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (1, 0), (1, 3), 'Helvetica'),
-        ('FONTNAME', (0, 4), (-1, 4), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ('TOPPADDING', (0, 0), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#D1D5DB')),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
-    elements.append(workflow_table)
-
-    elements.append(PageBreak())
-
-    # ============================================================
-    # PAGE 5: TECHNICAL IMPLEMENTATION
-    # ============================================================
-
-    elements.append(Paragraph("Technical Implementation", heading_style))
-    elements.append(Spacer(1, 0.15*inch))
-
-    # Technology stack
-    tech_data = [
-        ['Component', 'Technology', 'Status'],
-        ['Backend', 'Python + FastAPI', '✅ Complete'],
-        ['Database', 'PostgreSQL + SQLAlchemy', '✅ Complete'],
-        ['Frontend', 'Next.js 16 + React 19', '✅ Complete'],
-        ['AI Analysis', 'OpenAI GPT-4 Vision', '✅ Working'],
-        ['Imagery', 'Google Maps + Mapbox', '✅ Working'],
-        ['Skip Tracing', 'Tracerfy API', '⚠️ Needs API Key'],
-        ['UI Framework', 'Tailwind CSS + Framer Motion', '✅ Complete'],
-    ]
-
-    tech_table = Table(tech_data, colWidths=[1.5*inch, 2.8*inch, 1.8*inch])
-    tech_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1F2937')),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('TEXTCOLOR', (0, 1), (-1, -1), colors.HexColor('#374151')),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        ('ALIGN', (0, 1), (-1, -1), 'LEFT'),
-        ('ALIGN', (2, 1), (2, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (1, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#D1D5DB')),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
-    elements.append(tech_table)
-
-    elements.append(Spacer(1, 0.2*inch))
-
-    # Bug fixes
-    elements.append(Paragraph("Bug Fixes Applied", ParagraphStyle(
-        'SectionHead',
-        parent=styles['Heading3'],
-        fontSize=13,
-        textColor=colors.HexColor('#1F2937'),
-        spaceAfter=10,
-        fontName='Helvetica-Bold'
-    )))
-
-    bug_fixes = [
-        'Fixed property field error in skip trace function',
-        'Fixed BatchData API request format',
-        'Fixed ThreadPoolExecutor crash with zero properties',
-        'Removed non-working satellite view imagery',
-        'Enhanced UI with premium gradient design',
-        'Improved status messages and user feedback',
-    ]
-
-    for fix in bug_fixes:
-        elements.append(Paragraph(f"✓ {fix}", feature_style))
-
-    elements.append(PageBreak())
-
-    # ============================================================
-    # PAGE 6: SKIP TRACING SETUP
-    # ============================================================
-
-    elements.append(Paragraph("Skip Tracing - Action Required", heading_style))
-    elements.append(Spacer(1, 0.15*inch))
-
-    # Important notice box
-    notice_data = [['⚠️  SKIP TRACING API KEY NEEDED']]
-    notice_table = Table(notice_data, colWidths=[6*inch])
-    notice_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#FEF3C7')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#92400E')),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 14),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-        ('TOPPADDING', (0, 0), (-1, -1), 12),
-        ('GRID', (0, 0), (-1, -1), 2, colors.HexColor('#F59E0B')),
-    ]))
-    elements.append(notice_table)
-
-    elements.append(Spacer(1, 0.2*inch))
-
-    skip_text = """
-    The skip tracing functionality is <b>fully implemented and ready to use</b>. However,
-    it requires an active API key from Tracerfy to function. Once you obtain the API key,
-    simply add it to the configuration file and the feature will work immediately.
-    """
-    elements.append(Paragraph(skip_text, body_style))
-    elements.append(Spacer(1, 0.15*inch))
-
-    # Provider info
-    elements.append(Paragraph("Recommended Provider: Tracerfy", ParagraphStyle(
-        'SectionHead',
-        parent=styles['Heading3'],
-        fontSize=13,
-        textColor=colors.HexColor('#1F2937'),
-        spaceAfter=10,
-        fontName='Helvetica-Bold'
-    )))
-
-    provider_data = [
-        ['Feature', 'Details'],
-        ['Provider', 'Tracerfy (https://tracerfy.com)'],
-        ['Cost', '$0.009 per lead (most competitive pricing)'],
-        ['Accuracy', '70-97% match rate'],
-        ['Data Provided', 'Names, phones, emails, mailing addresses'],
-        ['Setup Time', '5 minutes (just add API key to .env file)'],
-    ]
-
-    provider_table = Table(provider_data, colWidths=[1.5*inch, 4.6*inch])
-    provider_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#EEF2FF')),
-        ('BACKGROUND', (0, 1), (0, -1), colors.HexColor('#F9FAFB')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#1F2937')),
-        ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (1, 1), (1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#D1D5DB')),
-    ]))
-    elements.append(provider_table)
-
-    elements.append(Spacer(1, 0.2*inch))
-
-    # Setup instructions
-    elements.append(Paragraph("Setup Instructions:", ParagraphStyle(
-        'SectionHead',
-        parent=styles['Heading3'],
-        fontSize=13,
-        textColor=colors.HexColor('#1F2937'),
-        spaceAfter=10,
-        fontName='Helvetica-Bold'
-    )))
-
-    setup_steps = [
-        '1. Sign up for Tracerfy account at https://tracerfy.com',
-        '2. Obtain your API key from the dashboard',
-        '3. Open the file: <b>backend/.env</b>',
-        '4. Replace the placeholder with your actual API key',
-        '5. Restart the backend server',
-        '6. Click "Find Owners" button to test - it will work immediately!',
-    ]
-
-    for step in setup_steps:
-        elements.append(Paragraph(step, feature_style))
-
-    elements.append(PageBreak())
-
-    # ============================================================
-    # PAGE 7: HOW TO USE
-    # ============================================================
-
-    elements.append(Paragraph("How to Use the System", heading_style))
-    elements.append(Spacer(1, 0.15*inch))
-
-    usage_text = """
-    The system is designed for ease of use with a simple 3-step workflow:
-    """
-    elements.append(Paragraph(usage_text, body_style))
-    elements.append(Spacer(1, 0.15*inch))
-
-    # Step 1
-    step1_data = [['STEP 1: Upload & Filter (FREE - $0 Cost)']]
-    step1_table = Table(step1_data, colWidths=[6*inch])
-    step1_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#DBEAFE')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#1E40AF')),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 12),
-    ]))
-    elements.append(step1_table)
-
-    step1_items = [
-        '• Upload CSV file with property addresses',
-        '• Wait 2-3 minutes for automatic risk analysis',
-        '• Use risk filter to select only LOW/MEDIUM risk properties',
-        '• Use county/zip filters to narrow to target areas',
-        '• Review filtered list - this is your target set!',
-    ]
-    for item in step1_items:
-        elements.append(Paragraph(item, feature_style))
-
-    elements.append(Spacer(1, 0.15*inch))
-
-    # Step 2
-    step2_data = [['STEP 2: Run Paid Features (Only on Filtered Properties)']]
-    step2_table = Table(step2_data, colWidths=[6*inch])
-    step2_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#DDD6FE')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#5B21B6')),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 12),
-    ]))
-    elements.append(step2_table)
-
-    step2_items = [
-        '• Click "Run AI Analysis" button (analyzes only visible properties)',
-        '• Wait 2-5 minutes for AI processing',
-        '• View premium insights: road conditions, power lines, development',
-        '• Click "Find Owners" button (traces only visible properties)',
-        '• Wait 2-5 minutes for owner lookup',
-        '• View contact information: names, phones, emails, addresses',
-    ]
-    for item in step2_items:
-        elements.append(Paragraph(item, feature_style))
-
-    elements.append(Spacer(1, 0.15*inch))
-
-    # Step 3
-    step3_data = [['STEP 3: Export & Use Results']]
-    step3_table = Table(step3_data, colWidths=[6*inch])
-    step3_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#D1FAE5')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#065F46')),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 12),
-    ]))
-    elements.append(step3_table)
-
-    step3_items = [
-        '• Click "Export CSV" button',
-        '• Download complete analysis with all data',
-        '• Import into your CRM or calling system',
-        '• Start contacting property owners!',
-    ]
-    for item in step3_items:
-        elements.append(Paragraph(item, feature_style))
-
-    elements.append(PageBreak())
-
-    # ============================================================
-    # PAGE 8: TESTING & VERIFICATION
-    # ============================================================
-
-    elements.append(Paragraph("Testing & Verification", heading_style))
-    elements.append(Spacer(1, 0.15*inch))
-
-    testing_text = """
-    The system has been thoroughly tested with all features verified to work correctly.
-    A demonstration video has been recorded showing all functionality in action.
-    """
-    elements.append(Paragraph(testing_text, body_style))
-    elements.append(Spacer(1, 0.2*inch))
-
-    # Test results
-    elements.append(Paragraph("Test Results:", ParagraphStyle(
-        'SectionHead',
-        parent=styles['Heading3'],
-        fontSize=13,
-        textColor=colors.HexColor('#1F2937'),
-        spaceAfter=10,
-        fontName='Helvetica-Bold'
-    )))
-
-    test_data = [
-        ['Feature', 'Status', 'Notes'],
-        ['CSV Upload', '✅ Pass', 'Tested with sample properties'],
-        ['Risk Analysis', '✅ Pass', 'FREE analysis working perfectly'],
-        ['Filtering System', '✅ Pass', 'All filters functional'],
-        ['AI Analysis', '✅ Pass', 'Street View + AI detections working'],
-        ['Premium UI', '✅ Pass', 'Gradient design displays correctly'],
-        ['Skip Tracing', '⚠️ Ready', 'Waiting for API key activation'],
-        ['CSV Export', '✅ Pass', 'All data columns exported'],
-        ['Frontend Build', '✅ Pass', '0 TypeScript errors'],
-        ['Backend Server', '✅ Pass', 'All endpoints functional'],
-    ]
-
-    test_table = Table(test_data, colWidths=[1.8*inch, 1*inch, 3.3*inch])
-    test_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1F2937')),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('TEXTCOLOR', (0, 1), (-1, -1), colors.HexColor('#374151')),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        ('ALIGN', (0, 1), (1, -1), 'LEFT'),
-        ('ALIGN', (1, 1), (1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (1, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('TOPPADDING', (0, 0), (-1, -1), 6),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#D1D5DB')),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
-    elements.append(test_table)
+    def _page_cover():
+        """Page 1: Cover Page"""
+
+        # Title
+        # Cover-page top gap: spaceBefore is ignored at the top of a frame,
+        # so this one gap has to stay a real flowable
+        yield Spacer(1, 1.5*inch)
+        yield Paragraph("Property Analysis System", title_style)
+        yield Paragraph("Project Delivery Report", subtitle_style)
+
+
+        # Status badge (using table)
+        status_data = [['✅ PRODUCTION READY']]
+        status_table = Table(status_data, colWidths=[4*inch], spaceAfter=0.8*inch)
+        status_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, -1), PALETTE['emerald']),
+            ('TEXTCOLOR', (0, 0), (-1, -1), colors.white),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 16),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+            ('TOPPADDING', (0, 0), (-1, -1), 12),
+            ('GRID', (0, 0), (-1, -1), 2, PALETTE['emerald-600']),
+        ]))
+        yield status_table
+
+
+        # Project info
+        project_info = [
+            ['Project:', 'AI-Powered Property Analysis Platform'],
+            ['Delivery Date:', datetime.now().strftime('%B %d, %Y')],
+            ['Status:', 'Complete & Tested'],
+            ['Version:', '1.0 - Production Ready'],
+        ]
+
+        info_table = Table(project_info, colWidths=[1.5*inch, 4*inch])
+        info_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (0, -1), PALETTE['gray-100']),
+            ('TEXTCOLOR', (0, 0), (-1, -1), PALETTE['gray-800']),
+            ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+            ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, -1), 11),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('GRID', (0, 0), (-1, -1), 1, PALETTE['gray-200']),
+        ]))
+        yield info_table
+
+
+    def _page_summary():
+        """Page 2: Executive Summary"""
+
+        yield Paragraph("Executive Summary", heading_style)
+
+        summary_text = """
+        Your AI-powered property analysis system is now <b>complete and ready for production use</b>.
+        All core features have been implemented, tested, and verified to work correctly. The system
+        includes advanced AI imagery analysis, automated risk assessment, and skip tracing capabilities
+        (pending API key activation).
+        """
+        yield Paragraph(summary_text, body_style)
+
+        # Key highlights
+        yield Paragraph("Key Highlights:", heading_style)
+
+        highlights_data = [
+            ['✅', 'AI-Powered Analysis', 'Computer vision analysis of property imagery'],
+            ['✅', 'Risk Assessment', 'Automated GIS-based risk scoring (FREE)'],
+            ['✅', 'Skip Tracing Ready', 'Owner lookup system (needs API key)'],
+            ['✅', 'Smart Filtering', 'Built-in workflow focuses on quality properties'],
+            ['✅', 'Premium UI/UX', 'Professional gradient design for paid features'],
+            ['✅', 'Export Functionality', 'Complete CSV export with all data'],
+        ]
+
+        highlights_table = Table(highlights_data, colWidths=[0.4*inch, 1.8*inch, 3.8*inch])
+        highlights_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, -1), PALETTE['gray-50']),
+            ('TEXTCOLOR', (0, 0), (0, -1), PALETTE['emerald']),
+            ('TEXTCOLOR', (1, 0), (-1, -1), PALETTE['gray-800']),
+            ('ALIGN', (0, 0), (0, -1), 'CENTER'),
+            ('ALIGN', (1, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+            ('FONTNAME', (1, 0), (1, -1), 'Helvetica-Bold'),
+            ('FONTNAME', (2, 0), (2, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('GRID', (0, 0), (-1, -1), 1, PALETTE['gray-200']),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ]))
+        yield highlights_table
+
+
+    def _page_features():
+        """Page 3: Features Implemented"""
+
+        yield Paragraph("Features Implemented", heading_style)
+
+        # FREE Features
+        yield Paragraph("FREE Features (No Cost Per Use)", ParagraphStyle(
+            'SectionHead',
+            parent=styles['Heading3'],
+            fontSize=14,
+            textColor=PALETTE['emerald-600'],
+            spaceAfter=10,
+            fontName='Helvetica-Bold'
+        ))
+
+        free_features = [
+            'CSV Upload - Support for large property lists',
+            'Address Geocoding - Automatic latitude/longitude conversion',
+            'GIS Risk Analysis - Wetlands, flood zones, slope analysis',
+            'Road Access Detection - Identifies property accessibility',
+            'Protected Land Checks - Conservation areas, parks, etc.',
+            'Utility Detection - Water and sewer availability',
+            'Legal Descriptions - Complete property descriptions',
+            'Risk Filtering - Filter by HIGH/MEDIUM/LOW risk levels',
+            'County/Zip Filtering - Target specific geographical areas',
+            'CSV Export - Download all results with complete data',
+        ]
+
+        for feature in free_features:
+            yield feature_line(f"• {feature}", feature_style)
+
+
+        # PAID Features
+        yield Paragraph("PAID Features (Run Only on Filtered Properties)", ParagraphStyle(
+            'SectionHead',
+            parent=styles['Heading3'],
+            fontSize=14,
+            textColor=PALETTE['indigo'],
+            spaceBefore=14,
+            spaceAfter=10,
+            fontName='Helvetica-Bold'
+        ))
+
+        paid_features = [
+            '<b>AI Imagery Analysis</b> (~$0.01-0.03 per property)',
+            '  - Road condition detection (PAVED/DIRT/GRAVEL/POOR)',
+            '  - Power line detection with distance estimation',
+            '  - Development classification (RESIDENTIAL/COMMERCIAL/etc.)',
+            '  - Confidence scores for all AI detections',
+            '  - Google Street View integration',
+            '',
+            '<b>Skip Tracing</b> (~$0.009 per property with Tracerfy)',
+            '  - Owner full name (first, middle, last)',
+            '  - Up to 3 phone numbers (primary, mobile, secondary)',
+            '  - Up to 2 email addresses',
+            '  - Complete mailing address',
+            '  - Owner type and occupancy status',
+            '  - 70-97% accuracy rate',
+        ]
+
+        for feature in paid_features:
+            yield feature_line(f"• {feature}", feature_style)
+
+
+    def _page_workflow():
+        """Page 4: Smart Filtering Workflow"""
+
+        yield Paragraph("Smart Filtering Workflow", heading_style)
+
+        cost_text = """
+        The system includes a <b>built-in smart filtering workflow</b> that helps you identify
+        the best properties before running paid analysis. This intelligent approach focuses your
+        resources on high-quality opportunities.
+        """
+        yield Paragraph(cost_text, body_style)
+
+        # Workflow steps
+        yield Paragraph("How It Works:", ParagraphStyle(
+            'SectionHead',
+            parent=styles['Heading3'],
+            fontSize=13,
+            textColor=PALETTE['gray-800'],
+            spaceAfter=10,
+            fontName='Helvetica-Bold'
+        ))
+
+        workflow_steps = [
+            ['Step 1', 'Upload all properties → Automatic FREE risk analysis'],
+            ['Step 2', 'Filter to LOW/MEDIUM risk only → Focus on quality'],
+            ['Step 3', 'Run AI Analysis → Only on filtered properties'],
+            ['Step 4', 'Run Skip Trace → Only on filtered properties'],
+            ['Result', 'Complete analysis with maximum efficiency'],
+        ]
+
+        workflow_table = Table(workflow_steps, colWidths=[0.9*inch, 5.2*inch])
+        workflow_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (0, 3), PALETTE['indigo-50']),
+            ('BACKGROUND', (1, 0), (1, 3), PALETTE['gray-50']),
+            ('BACKGROUND', (0, 4), (0, 4), PALETTE['emerald']),
+            ('BACKGROUND', (1, 4), (1, 4), PALETTE['emerald-100']),
+            ('TEXTCOLOR', (0, 0), (-1, 3), PALETTE['gray-800']),
+            ('TEXTCOLOR', (0, 4), (0, 4), colors.white),
+            ('TEXTCOLOR', (1, 4), (1, 4), PALETTE['emerald-800']),
+            ('ALIGN', (0, 0), (0, -1), 'CENTER'),
+            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+            ('FONTNAME', (1, 0), (1, 3), 'Helvetica'),
+            ('FONTNAME', (0, 4), (-1, 4), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 11),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+            ('TOPPADDING', (0, 0), (-1, -1), 10),
+            ('GRID', (0, 0), (-1, -1), 1, PALETTE['gray-300']),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ]))
+        yield workflow_table
+
+
+    def _page_technical():
+        """Page 5: Technical Implementation"""
+
+        yield Paragraph("Technical Implementation", heading_style)
+
+        # Technology stack
+        tech_data = [
+            ['Component', 'Technology', 'Status'],
+            ['Backend', 'Python + FastAPI', '✅ Complete'],
+            ['Database', 'PostgreSQL + SQLAlchemy', '✅ Complete'],
+            ['Frontend', 'Next.js 16 + React 19', '✅ Complete'],
+            ['AI Analysis', 'OpenAI GPT-4 Vision', '✅ Working'],
+            ['Imagery', 'Google Maps + Mapbox', '✅ Working'],
+            ['Skip Tracing', 'Tracerfy API', '⚠️ Needs API Key'],
+            ['UI Framework', 'Tailwind CSS + Framer Motion', '✅ Complete'],
+        ]
+
+        tech_table = Table(tech_data, colWidths=[1.5*inch, 2.8*inch, 1.8*inch])
+        tech_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), PALETTE['gray-800']),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('TEXTCOLOR', (0, 1), (-1, -1), PALETTE['gray-700']),
+            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+            ('ALIGN', (0, 1), (-1, -1), 'LEFT'),
+            ('ALIGN', (2, 1), (2, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
+            ('FONTNAME', (1, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('GRID', (0, 0), (-1, -1), 1, PALETTE['gray-300']),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ]))
+        yield tech_table
+
+
+        # Bug fixes
+        yield Paragraph("Bug Fixes Applied", ParagraphStyle(
+            'SectionHead',
+            parent=styles['Heading3'],
+            fontSize=13,
+            textColor=PALETTE['gray-800'],
+            spaceBefore=14,
+            spaceAfter=10,
+            fontName='Helvetica-Bold'
+        ))
+
+        bug_fixes = [
+            'Fixed property field error in skip trace function',
+            'Fixed BatchData API request format',
+            'Fixed ThreadPoolExecutor crash with zero properties',
+            'Removed non-working satellite view imagery',
+            'Enhanced UI with premium gradient design',
+            'Improved status messages and user feedback',
+        ]
+
+        for fix in bug_fixes:
+            yield feature_line(f"✓ {fix}", feature_style)
+
+
+    def _page_skip_tracing():
+        """Page 6: Skip Tracing Setup"""
+
+        yield Paragraph("Skip Tracing - Action Required", heading_style)
+
+        # Important notice box
+        notice_data = [['⚠️  SKIP TRACING API KEY NEEDED']]
+        notice_table = Table(notice_data, colWidths=[6*inch], spaceAfter=0.2*inch)
+        notice_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, -1), PALETTE['amber-100']),
+            ('TEXTCOLOR', (0, 0), (-1, -1), PALETTE['amber-800']),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 14),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+            ('TOPPADDING', (0, 0), (-1, -1), 12),
+            ('GRID', (0, 0), (-1, -1), 2, PALETTE['amber-500']),
+        ]))
+        yield notice_table
+
+
+        skip_text = """
+        The skip tracing functionality is <b>fully implemented and ready to use</b>. However,
+        it requires an active API key from Tracerfy to function. Once you obtain the API key,
+        simply add it to the configuration file and the feature will work immediately.
+        """
+        yield Paragraph(skip_text, body_style)
+
+        # Provider info
+        yield Paragraph("Recommended Provider: Tracerfy", ParagraphStyle(
+            'SectionHead',
+            parent=styles['Heading3'],
+            fontSize=13,
+            textColor=PALETTE['gray-800'],
+            spaceAfter=10,
+            fontName='Helvetica-Bold'
+        ))
+
+        provider_data = [
+            ['Feature', 'Details'],
+            ['Provider', 'Tracerfy (https://tracerfy.com)'],
+            ['Cost', '$0.009 per lead (most competitive pricing)'],
+            ['Accuracy', '70-97% match rate'],
+            ['Data Provided', 'Names, phones, emails, mailing addresses'],
+            ['Setup Time', '5 minutes (just add API key to .env file)'],
+        ]
+
+        provider_table = Table(provider_data, colWidths=[1.5*inch, 4.6*inch])
+        provider_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), PALETTE['indigo-50']),
+            ('BACKGROUND', (0, 1), (0, -1), PALETTE['gray-50']),
+            ('TEXTCOLOR', (0, 0), (-1, -1), PALETTE['gray-800']),
+            ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
+            ('FONTNAME', (1, 1), (1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('GRID', (0, 0), (-1, -1), 1, PALETTE['gray-300']),
+        ]))
+        yield provider_table
+
+
+        # Setup instructions
+        yield Paragraph("Setup Instructions:", ParagraphStyle(
+            'SectionHead',
+            parent=styles['Heading3'],
+            fontSize=13,
+            textColor=PALETTE['gray-800'],
+            spaceBefore=14,
+            spaceAfter=10,
+            fontName='Helvetica-Bold'
+        ))
+
+        setup_steps = [
+            '1. Sign up for Tracerfy account at https://tracerfy.com',
+            '2. Obtain your API key from the dashboard',
+            '3. Open the file: <b>backend/.env</b>',
+            '4. Replace the placeholder with your actual API key',
+            '5. Restart the backend server',
+            '6. Click "Find Owners" button to test - it will work immediately!',
+        ]
+
+        for step in setup_steps:
+            yield feature_line(step, feature_style)
+
+
+    def _page_usage():
+        """Page 7: How To Use"""
+
+        yield Paragraph("How to Use the System", heading_style)
+
+        usage_text = """
+        The system is designed for ease of use with a simple 3-step workflow:
+        """
+        yield Paragraph(usage_text, body_style)
+
+        # Step 1
+        step1_data = [['STEP 1: Upload & Filter (FREE - $0 Cost)']]
+        step1_table = Table(step1_data, colWidths=[6*inch])
+        step1_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, -1), PALETTE['blue-100']),
+            ('TEXTCOLOR', (0, 0), (-1, -1), PALETTE['blue-800']),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 12),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('LEFTPADDING', (0, 0), (-1, -1), 12),
+        ]))
+        yield step1_table
+
+        step1_items = [
+            '• Upload CSV file with property addresses',
+            '• Wait 2-3 minutes for automatic risk analysis',
+            '• Use risk filter to select only LOW/MEDIUM risk properties',
+            '• Use county/zip filters to narrow to target areas',
+            '• Review filtered list - this is your target set!',
+        ]
+        for item in step1_items:
+            yield feature_line(item, feature_style)
+
+
+        # Step 2
+        step2_data = [['STEP 2: Run Paid Features (Only on Filtered Properties)']]
+        step2_table = Table(step2_data, colWidths=[6*inch], spaceBefore=0.15*inch)
+        step2_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, -1), PALETTE['violet-200']),
+            ('TEXTCOLOR', (0, 0), (-1, -1), PALETTE['violet-800']),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 12),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('LEFTPADDING', (0, 0), (-1, -1), 12),
+        ]))
+        yield step2_table
+
+        step2_items = [
+            '• Click "Run AI Analysis" button (analyzes only visible properties)',
+            '• Wait 2-5 minutes for AI processing',
+            '• View premium insights: road conditions, power lines, development',
+            '• Click "Find Owners" button (traces only visible properties)',
+            '• Wait 2-5 minutes for owner lookup',
+            '• View contact information: names, phones, emails, addresses',
+        ]
+        for item in step2_items:
+            yield feature_line(item, feature_style)
+
+
+        # Step 3
+        step3_data = [['STEP 3: Export & Use Results']]
+        step3_table = Table(step3_data, colWidths=[6*inch], spaceBefore=0.15*inch)
+        step3_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, -1), PALETTE['emerald-100']),
+            ('TEXTCOLOR', (0, 0), (-1, -1), PALETTE['emerald-800']),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 12),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('LEFTPADDING', (0, 0), (-1, -1), 12),
+        ]))
+        yield step3_table
+
+        step3_items = [
+            '• Click "Export CSV" button',
+            '• Download complete analysis with all data',
+            '• Import into your CRM or calling system',
+            '• Start contacting property owners!',
+        ]
+        for item in step3_items:
+            yield feature_line(item, feature_style)
+
+
+    def _page_testing():
+        """Page 8: Testing & Verification"""
+
+        yield Paragraph("Testing & Verification", heading_style)
+
+        testing_text = """
+        The system has been thoroughly tested with all features verified to work correctly.
+        A demonstration video has been recorded showing all functionality in action.
+        """
+        yield Paragraph(testing_text, body_style)
+
+        # Test results
+        yield Paragraph("Test Results:", ParagraphStyle(
+            'SectionHead',
+            parent=styles['Heading3'],
+            fontSize=13,
+            textColor=PALETTE['gray-800'],
+            spaceAfter=10,
+            fontName='Helvetica-Bold'
+        ))
+
+        test_data = [
+            ['Feature', 'Status', 'Notes'],
+            ['CSV Upload', '✅ Pass', 'Tested with sample properties'],
+            ['Risk Analysis', '✅ Pass', 'FREE analysis working perfectly'],
+            ['Filtering System', '✅ Pass', 'All filters functional'],
+            ['AI Analysis', '✅ Pass', 'Street View + AI detections working'],
+            ['Premium UI', '✅ Pass', 'Gradient design displays correctly'],
+            ['Skip Tracing', '⚠️ Ready', 'Waiting for API key activation'],
+            ['CSV Export', '✅ Pass', 'All data columns exported'],
+            ['Frontend Build', '✅ Pass', '0 TypeScript errors'],
+            ['Backend Server', '✅ Pass', 'All endpoints functional'],
+        ]
+
+        test_table = Table(test_data, colWidths=[1.8*inch, 1*inch, 3.3*inch])
+        test_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), PALETTE['gray-800']),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('TEXTCOLOR', (0, 1), (-1, -1), PALETTE['gray-700']),
+            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+            ('ALIGN', (0, 1), (1, -1), 'LEFT'),
+            ('ALIGN', (1, 1), (1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
+            ('FONTNAME', (1, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+            ('TOPPADDING', (0, 0), (-1, -1), 6),
+            ('GRID', (0, 0), (-1, -1), 1, PALETTE['gray-300']),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ]))
+        yield test_table
+
+
+    def page_flowables():
+        """Yield the report flowables page by page in document order.
+
+        doc.build() needs the whole story as a list, so this is about
+        keeping each page's construction in its own function, not about
+        bounding memory.
+        """
+        pages = (_page_cover, _page_summary, _page_features, _page_workflow, _page_technical, _page_skip_tracing, _page_usage, _page_testing)
+        for n, page in enumerate(pages):
+            if n:
+                yield PageBreak()
+            yield from page()
 
     # Build PDF
-    doc.build(elements)
+    doc.build(list(page_flowables()))
+    pdf_file.close()
     print(f"\n✅ PDF Report Generated: {filename}")
     print(f"📄 Pages: 8")
     print(f"📊 Sections: Executive Summary, Features, Smart Filtering, Technical Details, Skip Tracing, How to Use, Testing")
 
     return filename
 
+def serve(port=8099):
+    """Serve renders from a long-lived worker process.
+
+    The reportlab import chain costs ~200ms cold; spawning a fresh Python per
+    report repays it every time. Running `python generate_client_report.py
+    --serve` imports once at startup, then each POST /render reuses the warm
+    interpreter and returns the PDF bytes.
+    """
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    class RenderHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            if self.path != '/render':
+                self.send_error(404)
+                return
+            try:
+                filename = create_client_report()
+                with open(filename, 'rb') as f:
+                    pdf_bytes = f.read()
+            except Exception as e:
+                self.send_error(500, str(e))
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/pdf')
+            self.send_header('Content-Length', str(len(pdf_bytes)))
+            self.end_headers()
+            self.wfile.write(pdf_bytes)
+
+    print(f"📡 Report worker listening on http://127.0.0.1:{port}/render")
+    HTTPServer(('127.0.0.1', port), RenderHandler).serve_forever()
+
+
 if __name__ == "__main__":
-    try:
-        pdf_file = create_client_report()
-        print(f"\n🎉 Success! Report ready for client delivery.")
-        print(f"📍 Location: {os.path.abspath(pdf_file)}")
-    except Exception as e:
-        print(f"\n❌ Error generating report: {str(e)}")
-        import traceback
-        traceback.print_exc()
+    if '--serve' in sys.argv:
+        serve()
+    else:
+        try:
+            pdf_file = create_client_report()
+            print(f"\n🎉 Success! Report ready for client delivery.")
+            print(f"📍 Location: {os.path.abspath(pdf_file)}")
+        except Exception as e:
+            print(f"\n❌ Error generating report: {str(e)}")
+            import traceback
+            traceback.print_exc()
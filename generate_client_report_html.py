@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Generate the client delivery report via a templated HTML -> PDF pipeline.
+
+Faster alternative to the reportlab flowable builder in generate_client_report.py:
+the report content is plain data rendered once through report.html.j2, and the
+browser/WeasyPrint layout engine does the page layout in one batch instead of
+per-flowable wrap calculations in Python.
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+from datetime import datetime
+
+from jinja2 import Environment, FileSystemLoader
+
+TEMPLATE_DIR = os.path.dirname(os.path.abspath(__file__))
+TEMPLATE_NAME = "report.html.j2"
+
+
+def build_report_data():
+    """Assemble the report content as plain data for the template."""
+    return {
+        "project_info": [
+            ("Project:", "AI-Powered Property Analysis Platform"),
+            ("Delivery Date:", datetime.now().strftime("%B %d, %Y")),
+            ("Status:", "Complete & Tested"),
+            ("Version:", "1.0 - Production Ready"),
+        ],
+        "summary_text": (
+            "Your AI-powered property analysis system is now complete and ready for "
+            "production use. All core features have been implemented, tested, and "
+            "verified to work correctly. The system includes advanced AI imagery "
+            "analysis, automated risk assessment, and skip tracing capabilities "
+            "(pending API key activation)."
+        ),
+        "highlights": [
+            ("AI-Powered Analysis", "Computer vision analysis of property imagery"),
+            ("Risk Assessment", "Automated GIS-based risk scoring (FREE)"),
+            ("Skip Tracing Ready", "Owner lookup system (needs API key)"),
+            ("Smart Filtering", "Built-in workflow focuses on quality properties"),
+            ("Premium UI/UX", "Professional gradient design for paid features"),
+            ("Export Functionality", "Complete CSV export with all data"),
+        ],
+        "free_features": [
+            "CSV Upload - Support for large property lists",
+            "Address Geocoding - Automatic latitude/longitude conversion",
+            "GIS Risk Analysis - Wetlands, flood zones, slope analysis",
+            "Road Access Detection - Identifies property accessibility",
+            "Protected Land Checks - Conservation areas, parks, etc.",
+            "Utility Detection - Water and sewer availability",
+            "Legal Descriptions - Complete property descriptions",
+            "Risk Filtering - Filter by HIGH/MEDIUM/LOW risk levels",
+            "County/Zip Filtering - Target specific geographical areas",
+            "CSV Export - Download all results with complete data",
+        ],
+        "paid_features": [
+            "AI Imagery Analysis (~$0.01-0.03 per property)",
+            "  - Road condition detection (PAVED/DIRT/GRAVEL/POOR)",
+            "  - Power line detection with distance estimation",
+            "  - Development classification (RESIDENTIAL/COMMERCIAL/etc.)",
+            "  - Confidence scores for all AI detections",
+            "  - Google Street View integration",
+            "Skip Tracing (~$0.009 per property with Tracerfy)",
+            "  - Owner full name (first, middle, last)",
+            "  - Up to 3 phone numbers (primary, mobile, secondary)",
+            "  - Up to 2 email addresses",
+            "  - Complete mailing address",
+            "  - Owner type and occupancy status",
+            "  - 70-97% accuracy rate",
+        ],
+        "cost_text": (
+            "The system includes a built-in smart filtering workflow that helps you "
+            "identify the best properties before running paid analysis. This "
+            "intelligent approach focuses your resources on high-quality opportunities."
+        ),
+        "workflow_steps": [
+            ("Step 1", "Upload all properties → Automatic FREE risk analysis"),
+            ("Step 2", "Filter to LOW/MEDIUM risk only → Focus on quality"),
+            ("Step 3", "Run AI Analysis → Only on filtered properties"),
+            ("Step 4", "Run Skip Trace → Only on filtered properties"),
+            ("Result", "Complete analysis with maximum efficiency"),
+        ],
+        "tech_stack": [
+            ("Backend", "Python + FastAPI", "✅ Complete"),
+            ("Database", "PostgreSQL + SQLAlchemy", "✅ Complete"),
+            ("Frontend", "Next.js 16 + React 19", "✅ Complete"),
+            ("AI Analysis", "OpenAI GPT-4 Vision", "✅ Working"),
+            ("Imagery", "Google Maps + Mapbox", "✅ Working"),
+            ("Skip Tracing", "Tracerfy API", "⚠️ Needs API Key"),
+            ("UI Framework", "Tailwind CSS + Framer Motion", "✅ Complete"),
+        ],
+        "bug_fixes": [
+            "Fixed property field error in skip trace function",
+            "Fixed BatchData API request format",
+            "Fixed ThreadPoolExecutor crash with zero properties",
+            "Removed non-working satellite view imagery",
+            "Enhanced UI with premium gradient design",
+            "Improved status messages and user feedback",
+        ],
+        "skip_text": (
+            "The skip tracing functionality is fully implemented and ready to use. "
+            "However, it requires an active API key from Tracerfy to function. Once "
+            "you obtain the API key, simply add it to the configuration file and the "
+            "feature will work immediately."
+        ),
+        "provider_info": [
+            ("Provider", "Tracerfy (https://tracerfy.com)"),
+            ("Cost", "$0.009 per lead (most competitive pricing)"),
+            ("Accuracy", "70-97% match rate"),
+            ("Data Provided", "Names, phones, emails, mailing addresses"),
+            ("Setup Time", "5 minutes (just add API key to .env file)"),
+        ],
+        "setup_steps": [
+            "1. Sign up for Tracerfy account at https://tracerfy.com",
+            "2. Obtain your API key from the dashboard",
+            "3. Open the file: backend/.env",
+            "4. Replace the placeholder with your actual API key",
+            "5. Restart the backend server",
+            '6. Click "Find Owners" button to test - it will work immediately!',
+        ],
+        "usage_steps": [
+            ("step-1", "STEP 1: Upload & Filter (FREE - $0 Cost)", [
+                "Upload CSV file with property addresses",
+                "Wait 2-3 minutes for automatic risk analysis",
+                "Use risk filter to select only LOW/MEDIUM risk properties",
+                "Use county/zip filters to narrow to target areas",
+                "Review filtered list - this is your target set!",
+            ]),
+            ("step-2", "STEP 2: Run Paid Features (Only on Filtered Properties)", [
+                'Click "Run AI Analysis" button (analyzes only visible properties)',
+                "Wait 2-5 minutes for AI processing",
+                "View premium insights: road conditions, power lines, development",
+                'Click "Find Owners" button (traces only visible properties)',
+                "Wait 2-5 minutes for owner lookup",
+                "View contact information: names, phones, emails, addresses",
+            ]),
+            ("step-3", "STEP 3: Export & Use Results", [
+                'Click "Export CSV" button',
+                "Download complete analysis with all data",
+                "Import into your CRM or calling system",
+                "Start contacting property owners!",
+            ]),
+        ],
+        "testing_text": (
+            "The system has been thoroughly tested with all features verified to "
+            "work correctly. A demonstration video has been recorded showing all "
+            "functionality in action."
+        ),
+        "test_results": [
+            ("CSV Upload", "✅ Pass", "Tested with sample properties"),
+            ("Risk Analysis", "✅ Pass", "FREE analysis working perfectly"),
+            ("Filtering System", "✅ Pass", "All filters functional"),
+            ("AI Analysis", "✅ Pass", "Street View + AI detections working"),
+            ("Premium UI", "✅ Pass", "Gradient design displays correctly"),
+            ("Skip Tracing", "⚠️ Ready", "Waiting for API key activation"),
+            ("CSV Export", "✅ Pass", "All data columns exported"),
+            ("Frontend Build", "✅ Pass", "0 TypeScript errors"),
+            ("Backend Server", "✅ Pass", "All endpoints functional"),
+        ],
+    }
+
+
+def render_html():
+    """Render the report template to an HTML string (single parse-once pass)."""
+    env = Environment(loader=FileSystemLoader(TEMPLATE_DIR), autoescape=False)
+    template = env.get_template(TEMPLATE_NAME)
+    return template.render(data=build_report_data())
+
+
+def html_to_pdf(html: str, filename: str):
+    """Write the rendered HTML to PDF via WeasyPrint, or chromium headless as fallback."""
+    try:
+        from weasyprint import HTML
+        HTML(string=html, base_url=TEMPLATE_DIR).write_pdf(filename)
+        return
+    except ImportError:
+        pass
+
+    # Fallback: chromium/chrome headless print-to-pdf
+    browser = shutil.which("chromium") or shutil.which("chromium-browser") or shutil.which("google-chrome")
+    if not browser:
+        raise RuntimeError("Neither WeasyPrint nor a headless Chromium browser is available")
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".html", delete=False, encoding="utf-8") as tmp:
+        tmp.write(html)
+        tmp_html = tmp.name
+
+    try:
+        subprocess.run(
+            [browser, "--headless", "--disable-gpu", f"--print-to-pdf={os.path.abspath(filename)}", tmp_html],
+            check=True,
+            capture_output=True,
+        )
+    finally:
+        os.unlink(tmp_html)
+
+
+def create_client_report():
+    """Create the client delivery report PDF from the HTML template."""
+    filename = "Property_Analysis_System_Delivery_Report.pdf"
+    html = render_html()
+    html_to_pdf(html, filename)
+    print(f"\n✅ PDF Report Generated: {filename}")
+    print(f"📄 Pages: 8")
+    return filename
+
+
+if __name__ == "__main__":
+    try:
+        pdf_file = create_client_report()
+        print(f"\n🎉 Success! Report ready for client delivery.")
+        print(f"📍 Location: {os.path.abspath(pdf_file)}")
+    except Exception as e:
+        print(f"\n❌ Error generating report: {str(e)}")
+        import traceback
+        traceback.print_exc()
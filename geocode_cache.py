@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Persistent on-disk geocoding cache shared by the root test scripts.
+
+Nominatim lookups cost hundreds of milliseconds each and are rate limited to
+~1 req/s, so every re-run of a test script re-pays the full geocoding bill.
+Results are stored in a small sqlite database keyed by the normalized address,
+letting repeat runs skip the network entirely.
+"""
+
+import os
+import sqlite3
+import time
+from typing import Optional, Tuple
+
+DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".geocode_cache.db")
+
+# Parcels don't move; refresh entries quarterly just in case the geocoder improves
+DEFAULT_TTL_SECONDS = 90 * 24 * 3600
+
+_conn = None
+
+
+def _get_conn() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        _conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+        _conn.execute("PRAGMA journal_mode=WAL")
+        _conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, lat REAL, lon REAL, ts INTEGER)"
+        )
+        _conn.commit()
+    return _conn
+
+
+def make_key(address: str, city: str, state: str, zip_code: str) -> str:
+    """Normalize the address parts into a stable cache key."""
+    return "|".join((s or "").strip().lower() for s in (address, city, state, zip_code))
+
+
+def get(address: str, city: str, state: str, zip_code: str,
+        ttl: Optional[int] = DEFAULT_TTL_SECONDS) -> Optional[Tuple[float, float]]:
+    """Return the cached (lat, lon) or None on a miss/expired entry."""
+    row = _get_conn().execute(
+        "SELECT lat, lon, ts FROM cache WHERE key=?",
+        (make_key(address, city, state, zip_code),)
+    ).fetchone()
+    if row is None:
+        return None
+    lat, lon, ts = row
+    if ttl is not None and time.time() - ts > ttl:
+        return None
+    return (lat, lon)
+
+
+def put(address: str, city: str, state: str, zip_code: str,
+        lat: float, lon: float) -> None:
+    """Store a geocoding result."""
+    conn = _get_conn()
+    conn.execute(
+        "INSERT OR REPLACE INTO cache (key, lat, lon, ts) VALUES (?, ?, ?, ?)",
+        (make_key(address, city, state, zip_code), lat, lon, int(time.time()))
+    )
+    conn.commit()
+
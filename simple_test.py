@@ -14,28 +14,99 @@ load_dotenv('backend/.env')
 sys.path.insert(0, 'backend')
 
 from ai_analysis_improved import detect_power_lines_enhanced
+import asyncio
+import functools
+import io
+import socket
+import numpy as np
+from PIL import Image
 import requests
+from requests.adapters import HTTPAdapter
 import base64
 
-# Test addresses from CSV
-TEST_COORDINATES = [
-    {"address": "Lehigh Acres, FL", "lat": 26.604059, "lon": -81.658133},
-    {"address": "Lehigh Acres, FL", "lat": 26.577682, "lon": -81.684448},
-]
-
-def get_google_street_view(lat, lon, api_key):
-    """Get Google Street View image."""
-    url = f"https://maps.googleapis.com/maps/api/streetview"
-    params = {
-        "size": "600x400",
-        "location": f"{lat},{lon}",
-        "key": api_key
-    }
-
-    response = requests.get(url, params=params, timeout=10)
-    if response.status_code == 200:
-        return response.content
-    return None
+# Shared session so repeated Street View fetches reuse the same pooled
+# TCP+TLS connection instead of handshaking per request
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Test addresses from CSV, as a structured array so batch expansion stays
+# vectorized instead of per-row dict lookups
+TEST_COORDINATES = np.array(
+    [
+        ("Lehigh Acres, FL", 26.604059, -81.658133),
+        ("Lehigh Acres, FL", 26.577682, -81.684448),
+    ],
+    dtype=[("addr", "U64"), ("lat", "f8"), ("lon", "f8")],
+)
+
+# Precompute every "lat,lon" location parameter in one vectorized pass
+LOCATIONS = np.char.add(
+    np.char.add(TEST_COORDINATES["lat"].astype(str), ","),
+    TEST_COORDINATES["lon"].astype(str),
+)
+
+# URL and fixed request options bound once; per-call work is reduced to the
+# changing location/key params
+STREET_VIEW_URL = "https://maps.googleapis.com/maps/api/streetview"
+_FETCH = functools.partial(SESSION.get, STREET_VIEW_URL, stream=True, timeout=10)
+
+# Downloaded images are cached on disk keyed by location + size so repeated
+# test runs skip the re-download entirely; pass --no-cache to force fresh
+# fetches (e.g. in CI verification runs)
+SV_CACHE_DIR = ".sv_cache"
+USE_CACHE = "--no-cache" not in sys.argv
+
+def warm_connection(host="maps.googleapis.com"):
+    """Pre-resolve DNS and prime a pooled TLS connection to the imagery host.
+
+    The first TLS handshake costs ~100-200ms; paying it (and the DNS lookup,
+    which the OS resolver then has cached) before the batch starts takes that
+    latency out of the first real fetch. Best-effort: on failure the first
+    request simply pays full price.
+    """
+    try:
+        socket.getaddrinfo(host, 443, proto=socket.IPPROTO_TCP)
+        SESSION.head(f"https://{host}/", timeout=5)
+    except Exception:
+        pass
+
+def get_google_street_view(location, api_key):
+    """Get Google Street View image for a precomputed "lat,lon" location."""
+    cache_path = os.path.join(SV_CACHE_DIR, f"{location}_600x400.jpg")
+    if USE_CACHE and os.path.exists(cache_path):
+        with open(cache_path, "rb") as f:
+            return f.read()
+
+    response = _FETCH(params={"size": "600x400", "location": location, "key": api_key})
+    if response.status_code != 200:
+        return None
+
+    # Stream into a BytesIO pre-sized from Content-Length so the buffer never
+    # reallocates, instead of materializing response.content in one big copy
+    buf = io.BytesIO()
+    content_length = int(response.headers.get("Content-Length", 0))
+    if content_length:
+        buf.seek(content_length - 1)
+        buf.write(b"\0")
+        buf.seek(0)
+    written = 0
+    for chunk in response.iter_content(chunk_size=64 * 1024):
+        written += buf.write(chunk)
+
+    # Drop the pre-size padding, then treat a short body (truncated
+    # connection, or a Content-Encoding whose decoded size differs from the
+    # header) as a failed fetch rather than returning NUL-padded bytes
+    buf.truncate(written)
+    if content_length and written < content_length:
+        return None
+
+    data = buf.getvalue()
+    if USE_CACHE:
+        os.makedirs(SV_CACHE_DIR, exist_ok=True)
+        with open(cache_path, "wb") as f:
+            f.write(data)
+
+    return data
 
 print("="*80)
 print("SIMPLE AI DETECTION TEST")
@@ -56,47 +127,75 @@ if not openai_key:
 if not google_key:
     print("\n⚠️  WARNING: GOOGLE_MAPS_API_KEY not set - will use OpenStreetMap")
 
-# Test on first property
-test_prop = TEST_COORDINATES[0]
-print(f"\n{'='*80}")
-print(f"Testing: {test_prop['address']}")
-print(f"Coordinates: {test_prop['lat']}, {test_prop['lon']}")
-print(f"{'='*80}")
-
-# Get street view image
-print("\n📸 Fetching Google Street View image...")
-if google_key:
-    street_img = get_google_street_view(test_prop['lat'], test_prop['lon'], google_key)
+def shrink_image(image_bytes):
+    """Downscale and recompress an image before the OpenAI vision call.
+
+    Vision latency and billing scale with image tokens, which scale with
+    bytes; 512x384 at JPEG quality 70 roughly halves both with no effect on
+    power line visibility at this resolution.
+    """
+    img = Image.open(io.BytesIO(image_bytes))
+    img.thumbnail((512, 384), Image.LANCZOS)
+    buf = io.BytesIO()
+    img.save(buf, 'JPEG', quality=70, optimize=True)
+    return buf.getvalue()
+
+
+async def analyze_image(prop, street_img):
+    """Run power line detection on one downloaded image in a worker thread."""
+    print(f"\n🔌 Analyzing for power lines: {prop['addr']} ({prop['lat']}, {prop['lon']})...")
+    try:
+        result = await asyncio.to_thread(detect_power_lines_enhanced, street_img, "street")
+
+        print("\n" + "="*80)
+        print(f"POWER LINE DETECTION RESULTS - {prop['lat']}, {prop['lon']}")
+        print("="*80)
+        print(f"Visible: {result.get('visible')}")
+        print(f"Confidence: {result.get('confidence', 0):.2f}")
+        print(f"Type: {result.get('type', 'N/A')}")
+        print(f"Proximity: {result.get('proximity', 'N/A')}")
+        print(f"Source: {result.get('source', 'N/A')}")
+        print(f"\nDetails: {result.get('details', 'N/A')}")
+        print("="*80)
+
+        if result.get('visible'):
+            print("\n✅ SUCCESS - Power lines detected!")
+        else:
+            print("\n❌ No power lines detected")
+
+    except Exception as e:
+        print(f"\n❌ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+
+
+async def test_property(prop, location):
+    """Fetch Street View imagery and run detection for one property."""
+    street_img = await asyncio.to_thread(
+        get_google_street_view, location, google_key
+    )
     if street_img:
-        print(f"✓ Downloaded {len(street_img)} bytes")
-
-        # Test power line detection
-        print("\n🔌 Analyzing for power lines...")
-        try:
-            result = detect_power_lines_enhanced(street_img, "street")
-
-            print("\n" + "="*80)
-            print("POWER LINE DETECTION RESULTS")
-            print("="*80)
-            print(f"Visible: {result.get('visible')}")
-            print(f"Confidence: {result.get('confidence', 0):.2f}")
-            print(f"Type: {result.get('type', 'N/A')}")
-            print(f"Proximity: {result.get('proximity', 'N/A')}")
-            print(f"Source: {result.get('source', 'N/A')}")
-            print(f"\nDetails: {result.get('details', 'N/A')}")
-            print("="*80)
-
-            if result.get('visible'):
-                print("\n✅ SUCCESS - Power lines detected!")
-            else:
-                print("\n❌ No power lines detected")
-
-        except Exception as e:
-            print(f"\n❌ ERROR: {e}")
-            import traceback
-            traceback.print_exc()
+        print(f"✓ Downloaded {len(street_img)} bytes for {prop['lat']}, {prop['lon']}")
+        street_img = await asyncio.to_thread(shrink_image, street_img)
+        await analyze_image(prop, street_img)
     else:
-        print("❌ Failed to download street view image")
+        print(f"❌ Failed to download street view image for {prop['lat']}, {prop['lon']}")
+
+
+async def run_tests():
+    """Fire all Street View downloads concurrently and pipeline each into the AI check."""
+    print(f"\n{'='*80}")
+    print(f"Testing {len(TEST_COORDINATES)} properties concurrently")
+    print(f"{'='*80}")
+    print("\n📸 Fetching Google Street View images...")
+    await asyncio.gather(
+        *(test_property(p, loc) for p, loc in zip(TEST_COORDINATES, LOCATIONS))
+    )
+
+
+if google_key:
+    warm_connection()
+    asyncio.run(run_tests())
 else:
     print("❌ Cannot test without Google Maps API key")
 
@@ -8,22 +8,55 @@ with proper rate limiting and comprehensive logging.
 
 import sys
 import os
+import io
 import time
-import csv
-import requests
+import asyncio
+from collections import Counter
+from functools import lru_cache
+import pandas as pd
 from typing import Dict, List
 import logging
-
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+from logging.handlers import MemoryHandler
+
+# Setup logging: records buffer in memory and hit stderr in batches, so the
+# hot loop isn't paying a write syscall per line; ERRORs flush immediately
+# and mem_handler.flush() runs between properties
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 )
+mem_handler = MemoryHandler(capacity=200, flushLevel=logging.ERROR,
+                            target=_stream_handler)
+logging.basicConfig(level=logging.INFO, handlers=[mem_handler])
 logger = logging.getLogger(__name__)
 
 # Add backend to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend'))
 
+import geocode_cache
+import test_support
+
+# orjson serializes/parses several times faster than stdlib json; fall back
+# silently when it isn't installed
+try:
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj)
+
+    _json_loads = json.loads
+
+# Completed properties append here as they finish, so a crash mid-run loses
+# nothing and a restart skips work that's already persisted
+RESULTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results.jsonl")
+
 try:
     from imagery_service import ImageryService
     from ai_analysis_service import AIAnalysisService
@@ -32,8 +65,124 @@ except ImportError as e:
     sys.exit(1)
 
 
-def geocode_address(address: str, city: str, state: str, zip_code: str) -> tuple:
-    """Geocode an address using Nominatim."""
+@lru_cache(maxsize=1)
+def get_imagery_service() -> ImageryService:
+    """Singleton ImageryService; reruns in one interpreter reuse the instance."""
+    return ImageryService()
+
+
+@lru_cache(maxsize=1)
+def get_ai_service() -> AIAnalysisService:
+    """Singleton AIAnalysisService, sharing its HTTP session across reruns."""
+    return AIAnalysisService()
+
+
+class NominatimRateLimiter:
+    """Token bucket keeping concurrent geocodes at Nominatim's ~1 req/s policy."""
+
+    def __init__(self, min_interval: float = 1.05):
+        self.min_interval = min_interval
+        self._lock = asyncio.Lock()
+        self._last_request = 0.0
+
+    async def wait(self):
+        async with self._lock:
+            now = time.monotonic()
+            delay = self.min_interval - (now - self._last_request)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._last_request = time.monotonic()
+
+
+nominatim_limiter = NominatimRateLimiter()
+
+
+class TokenBucket:
+    """Classic token bucket: sustained `rate` requests/second with `burst` headroom.
+
+    Unlike a fixed sleep, short bursts (e.g. after a string of geocode
+    failures freed up the pipeline) proceed immediately while the long-run
+    rate stays capped.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < 1.0:
+                wait = (1.0 - self._tokens) / self.rate
+                await asyncio.sleep(wait)
+                self._updated = time.monotonic()
+                self._tokens = 1.0
+            self._tokens -= 1.0
+
+
+# Paces vision-API calls; override via env when the account tier allows more
+ai_bucket = TokenBucket(
+    rate=float(os.getenv("AI_RATE_LIMIT_RPS", "0.5")),
+    burst=int(os.getenv("AI_RATE_LIMIT_BURST", "2"))
+)
+
+
+class AIMDDelay:
+    """Adaptive per-call delay: decay toward a floor while the service is
+    healthy, double on rate-limit errors (AIMD, like TCP congestion control).
+
+    Converges to the smallest delay the provider tolerates instead of a
+    hand-tuned worst-case pad.
+    """
+
+    def __init__(self, start: float = 1.0, floor: float = 0.5, ceiling: float = 30.0):
+        self.delay = start
+        self.floor = floor
+        self.ceiling = ceiling
+
+    def success(self):
+        self.delay = max(self.floor, self.delay * 0.9)
+
+    def failure(self):
+        self.delay = min(self.ceiling, self.delay * 2)
+
+
+ai_delay = AIMDDelay()
+
+
+def _looks_rate_limited(exc: Exception) -> bool:
+    msg = str(exc).lower()
+    return "429" in msg or "rate" in msg or "too many requests" in msg
+
+# Serializes whole result blocks to stdout so concurrent stages never interleave
+print_lock = asyncio.Lock()
+
+# Shared pooled session (see test_support): sockets to
+# nominatim.openstreetmap.org are reused across scripts instead of a fresh
+# TCP+TLS handshake per geocode, with urllib3 retry/backoff on 429s and
+# transient gateway errors
+_session = test_support.get_session()
+
+
+async def geocode_address(address: str, city: str, state: str, zip_code: str) -> tuple:
+    """Geocode an address using Nominatim, consulting the on-disk cache first."""
+    # A blank street or zip can never geocode; fail fast instead of burning
+    # a rate-limited Nominatim slot on it
+    if not (address and address.strip() and zip_code and zip_code.strip()):
+        logger.warning(f"✗ Skipping blank address fields: {address!r}, {zip_code!r}")
+        return (None, None)
+
+    cached = geocode_cache.get(address, city, state, zip_code)
+    if cached is not None:
+        lat, lon = cached
+        logger.info(f"✓ Geocoded (cached): {address} -> ({lat:.6f}, {lon:.6f})")
+        return cached
+
     try:
         url = "https://nominatim.openstreetmap.org/search"
         params = {
@@ -45,16 +194,20 @@ def geocode_address(address: str, city: str, state: str, zip_code: str) -> tuple
             "format": "json",
             "limit": 1
         }
-        headers = {"User-Agent": "PropertyAnalysisTest/1.0"}
-
-        response = requests.get(url, params=params, headers=headers, timeout=10)
+        await nominatim_limiter.wait()
+        response = await asyncio.to_thread(
+            _session.get, url, params=params, timeout=10
+        )
 
         if response.status_code == 200:
-            results = response.json()
+            # Parse raw bytes directly; skips response.json()'s encoding
+            # sniffing and uses orjson when installed
+            results = _json_loads(response.content)
             if results:
                 lat = float(results[0]["lat"])
                 lon = float(results[0]["lon"])
                 logger.info(f"✓ Geocoded: {address} -> ({lat:.6f}, {lon:.6f})")
+                geocode_cache.put(address, city, state, zip_code, lat, lon)
                 return (lat, lon)
 
         logger.warning(f"✗ Could not geocode: {address}")
@@ -65,17 +218,15 @@ def geocode_address(address: str, city: str, state: str, zip_code: str) -> tuple
         return (None, None)
 
 
-def test_single_property(
+async def fetch_property_inputs(
     address: str,
     city: str,
     state: str,
     zip_code: str,
-    imagery_service: ImageryService,
-    ai_service: AIAnalysisService,
-    delay_seconds: float = 3.0
+    imagery_service: ImageryService
 ) -> Dict:
     """
-    Test AI detection on a single property.
+    Pipeline stage 1: geocode a property and fetch its imagery URLs.
 
     Args:
         address: Street address
@@ -83,31 +234,32 @@ def test_single_property(
         state: State
         zip_code: ZIP code
         imagery_service: Imagery service instance
-        ai_service: AI analysis service instance
-        delay_seconds: Delay between properties to avoid rate limits
 
     Returns:
-        Analysis results dictionary
+        Dict with lat/lon and imagery URLs, or an "error" entry on failure
     """
     logger.info("="*80)
     logger.info(f"TESTING: {address}, {city}, {state} {zip_code}")
     logger.info("="*80)
 
     # Geocode
-    lat, lon = geocode_address(address, city, state, zip_code)
+    lat, lon = await geocode_address(address, city, state, zip_code)
 
-    if not lat or not lon:
+    # Explicit None check: 0.0 is a valid coordinate and must not read as
+    # a failure (a false failure would re-burn the geocode next run)
+    if lat is None or lon is None:
         return {
             "address": address,
             "error": "geocoding_failed"
         }
 
-    time.sleep(1)  # Rate limit geocoding
+    # No extra sleep here: the Nominatim limiter already paces the HTTP call
+    # itself, and cache hits never touched the network at all
 
     # Get imagery
     logger.info("Fetching imagery...")
     try:
-        imagery = imagery_service.fetch_imagery(lat, lon)
+        imagery = await asyncio.to_thread(imagery_service.fetch_imagery, lat, lon)
 
         satellite_url = imagery.get("satellite_url")
         street_url = imagery.get("street_view_url")
@@ -129,95 +281,142 @@ def test_single_property(
             "error": "imagery_failed"
         }
 
-    # Wait before AI analysis to avoid rate limits
-    logger.info(f"Waiting {delay_seconds}s before AI analysis...")
-    time.sleep(delay_seconds)
+    return {
+        "address": address,
+        "lat": lat,
+        "lon": lon,
+        "satellite_url": satellite_url,
+        "street_url": street_url
+    }
 
-    # Run AI analysis
-    logger.info("Running AI analysis...")
-    try:
-        results = ai_service.analyze_property(
-            latitude=lat,
-            longitude=lon,
-            satellite_image_url=satellite_url,
-            street_image_url=street_url
-        )
 
-        # Print results
-        print_results(address, results)
+async def run_ai_analysis(
+    item: Dict,
+    ai_service: AIAnalysisService
+) -> Dict:
+    """
+    Pipeline stage 2: run AI analysis on prepared property inputs.
+
+    Args:
+        item: Output of fetch_property_inputs for one property
+        ai_service: AI analysis service instance
+
+    Returns:
+        Analysis results dictionary
+    """
+    address = item["address"]
+
+    for attempt in range(3):
+        # Token bucket caps sustained rate; the AIMD delay adds only as much
+        # extra pacing as recent errors say the provider needs
+        await ai_bucket.acquire()
+        await asyncio.sleep(ai_delay.delay)
+
+        logger.info("Running AI analysis...")
+        try:
+            results = await asyncio.to_thread(
+                ai_service.analyze_property,
+                latitude=item["lat"],
+                longitude=item["lon"],
+                satellite_image_url=item["satellite_url"],
+                street_image_url=item["street_url"]
+            )
+        except Exception as e:
+            if _looks_rate_limited(e) and attempt < 2:
+                ai_delay.failure()
+                logger.warning(
+                    f"AI rate limited, retrying in {ai_delay.delay:.1f}s: {e}"
+                )
+                continue
+            logger.error(f"AI analysis failed: {e}")
+            return {
+                "address": address,
+                "error": f"ai_failed: {str(e)}"
+            }
+
+        ai_delay.success()
+
+        # Print results as one block under the stdout lock
+        text = format_results(address, results)
+        async with print_lock:
+            sys.stdout.write(text)
 
         return {
             "address": address,
-            "lat": lat,
-            "lon": lon,
+            "lat": item["lat"],
+            "lon": item["lon"],
             "results": results
         }
 
-    except Exception as e:
-        logger.error(f"AI analysis failed: {e}")
-        return {
-            "address": address,
-            "error": f"ai_failed: {str(e)}"
-        }
 
+def format_results(address: str, results: Dict) -> str:
+    """Format analysis results as one string for a single stdout write.
+
+    Per-line print() calls each take the stdout lock and flush; building the
+    whole block in a StringIO keeps concurrent workers' output from
+    interleaving and makes stdout a single syscall per property.
+    """
+    buf = io.StringIO()
+    w = buf.write
 
-def print_results(address: str, results: Dict):
-    """Pretty print analysis results."""
-    print("\n" + "="*80)
-    print(f"RESULTS FOR: {address}")
-    print("="*80)
+    w("\n" + "="*80 + "\n")
+    w(f"RESULTS FOR: {address}\n")
+    w("="*80 + "\n")
 
-    # Power lines
+    # Hoist the section dicts (and their fields) into locals once
     power_lines = results.get("power_lines", {})
-    power_lines_street = results.get("power_lines_street", {})
+    pl_details = power_lines.get('details')
+
+    w(f"\n🔌 POWER LINES (SATELLITE):\n")
+    w(f"   Visible: {power_lines.get('visible', False)}\n")
+    w(f"   Confidence: {power_lines.get('confidence', 0.0):.2f}\n")
+    w(f"   Distance: {power_lines.get('distance_meters', 'N/A')} meters\n")
+    w(f"   Source: {power_lines.get('source', 'N/A')}\n")
+    if pl_details:
+        w(f"   Details: {pl_details[:200]}\n")
 
-    print(f"\n🔌 POWER LINES (SATELLITE):")
-    print(f"   Visible: {power_lines.get('visible', False)}")
-    print(f"   Confidence: {power_lines.get('confidence', 0.0):.2f}")
-    print(f"   Distance: {power_lines.get('distance_meters', 'N/A')} meters")
-    print(f"   Source: {power_lines.get('source', 'N/A')}")
-    if power_lines.get('details'):
-        print(f"   Details: {power_lines['details'][:200]}")
-
-    print(f"\n🔌 POWER LINES (STREET VIEW):")
-    print(f"   Visible: {power_lines_street.get('visible', False)}")
-    print(f"   Confidence: {power_lines_street.get('confidence', 0.0):.2f}")
-    print(f"   Type: {power_lines_street.get('type', 'N/A')}")
-    print(f"   Proximity: {power_lines_street.get('proximity', 'N/A')}")
-    print(f"   Source: {power_lines_street.get('source', 'N/A')}")
+    power_lines_street = results.get("power_lines_street", {})
+    w(f"\n🔌 POWER LINES (STREET VIEW):\n")
+    w(f"   Visible: {power_lines_street.get('visible', False)}\n")
+    w(f"   Confidence: {power_lines_street.get('confidence', 0.0):.2f}\n")
+    w(f"   Type: {power_lines_street.get('type', 'N/A')}\n")
+    w(f"   Proximity: {power_lines_street.get('proximity', 'N/A')}\n")
+    w(f"   Source: {power_lines_street.get('source', 'N/A')}\n")
 
     # Structures
     structures = results.get("nearby_structures", {})
-    print(f"\n🏘️  NEARBY STRUCTURES:")
-    print(f"   Detected: {structures.get('structures_detected', False)}")
-    print(f"   Count: {structures.get('count', 0)}")
-    print(f"   Types: {structures.get('types', [])}")
-    print(f"   Density: {structures.get('density', 'N/A')}")
-    print(f"   Confidence: {structures.get('confidence', 0.0):.2f}")
+    w(f"\n🏘️  NEARBY STRUCTURES:\n")
+    w(f"   Detected: {structures.get('structures_detected', False)}\n")
+    w(f"   Count: {structures.get('count', 0)}\n")
+    w(f"   Types: {structures.get('types', [])}\n")
+    w(f"   Density: {structures.get('density', 'N/A')}\n")
+    w(f"   Confidence: {structures.get('confidence', 0.0):.2f}\n")
 
     # Property condition
     prop_cond = results.get("property_condition", {})
-    print(f"\n🏠 PROPERTY CONDITION:")
-    print(f"   Condition: {prop_cond.get('condition', 'N/A')}")
-    print(f"   Maintained: {prop_cond.get('maintained', 'N/A')}")
-    print(f"   Development Status: {prop_cond.get('development_status', 'N/A')}")
-    print(f"   Confidence: {prop_cond.get('confidence', 0.0):.2f}")
+    w(f"\n🏠 PROPERTY CONDITION:\n")
+    w(f"   Condition: {prop_cond.get('condition', 'N/A')}\n")
+    w(f"   Maintained: {prop_cond.get('maintained', 'N/A')}\n")
+    w(f"   Development Status: {prop_cond.get('development_status', 'N/A')}\n")
+    w(f"   Confidence: {prop_cond.get('confidence', 0.0):.2f}\n")
 
     # Overall risk
     risk = results.get("overall_ai_risk", {})
-    print(f"\n⚠️  OVERALL AI RISK:")
-    print(f"   Level: {risk.get('level', 'N/A')}")
-    print(f"   Score: {risk.get('score', 0)}")
-    print(f"   Confidence: {risk.get('confidence', 0.0):.2f}")
-    print(f"   Power Lines Detected: {risk.get('power_lines_detected', False)}")
-    print(f"   Factors: {risk.get('factors', [])}")
+    w(f"\n⚠️  OVERALL AI RISK:\n")
+    w(f"   Level: {risk.get('level', 'N/A')}\n")
+    w(f"   Score: {risk.get('score', 0)}\n")
+    w(f"   Confidence: {risk.get('confidence', 0.0):.2f}\n")
+    w(f"   Power Lines Detected: {risk.get('power_lines_detected', False)}\n")
+    w(f"   Factors: {risk.get('factors', [])}\n")
 
-    print(f"\n⏱️  Processing Time: {results.get('processing_time_seconds', 0):.2f}s")
+    w(f"\n⏱️  Processing Time: {results.get('processing_time_seconds', 0):.2f}s\n")
 
-    if results.get('error'):
-        print(f"\n❌ ERROR: {results['error']}")
+    error = results.get('error')
+    if error:
+        w(f"\n❌ ERROR: {error}\n")
 
-    print("="*80 + "\n")
+    w("="*80 + "\n\n")
+    return buf.getvalue()
 
 
 def main():
@@ -233,90 +432,147 @@ def main():
     logger.info("="*80)
     logger.info(f"CSV File: {csv_path}")
 
-    # Initialize services
+    # Initialize services (cached: reruns in the same interpreter reuse them)
     logger.info("Initializing services...")
-    imagery_service = ImageryService()
-    ai_service = AIAnalysisService()
+    imagery_service = get_imagery_service()
+    ai_service = get_ai_service()
 
-    # Read CSV
-    properties = []
+    # Count rows for the prompt without materializing the file
     with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            properties.append({
-                "address": row.get("Street Address", ""),
-                "city": row.get("City", ""),
-                "state": row.get("State", ""),
-                "zip": row.get("Postal Code", "")
-            })
+        total_rows = sum(1 for _ in f) - 1
 
-    logger.info(f"Found {len(properties)} properties in CSV")
+    logger.info(f"Found {total_rows} properties in CSV")
 
     # Ask user how many to test
-    print(f"\nFound {len(properties)} properties.")
+    print(f"\nFound {total_rows} properties.")
     try:
         num_to_test = input("How many properties to test? (default: 3): ").strip()
         num_to_test = int(num_to_test) if num_to_test else 3
     except ValueError:
         num_to_test = 3
 
-    num_to_test = min(num_to_test, len(properties))
+    num_to_test = min(num_to_test, total_rows)
     logger.info(f"Testing {num_to_test} properties...")
 
-    # Test properties with increasing delays to avoid rate limits
-    results_list = []
-    base_delay = 5.0  # Start with 5 second delay
-
-    for i, prop in enumerate(properties[:num_to_test], 1):
-        logger.info(f"\n\n{'='*80}")
-        logger.info(f"PROPERTY {i}/{num_to_test}")
-        logger.info(f"{'='*80}")
-
-        # Increase delay after each property to avoid cumulative rate limiting
-        current_delay = base_delay + (i * 2)  # 5s, 7s, 9s, 11s...
-
-        result = test_single_property(
-            address=prop["address"],
-            city=prop["city"],
-            state=prop["state"],
-            zip_code=prop["zip"],
-            imagery_service=imagery_service,
-            ai_service=ai_service,
-            delay_seconds=current_delay
-        )
-
-        results_list.append(result)
-
-        # Extra delay between properties
-        if i < num_to_test:
-            wait_time = 10  # 10 seconds between properties
-            logger.info(f"\n⏳ Waiting {wait_time}s before next property to avoid rate limits...")
-            time.sleep(wait_time)
-
-    # Summary
-    print("\n" + "="*80)
-    print("TESTING COMPLETE - SUMMARY")
-    print("="*80)
-
-    successful = sum(1 for r in results_list if "results" in r)
-    failed = len(results_list) - successful
-
-    print(f"\nTotal Tested: {len(results_list)}")
-    print(f"Successful: {successful}")
-    print(f"Failed: {failed}")
-
-    # Power line detection summary
-    power_lines_detected = sum(
-        1 for r in results_list
-        if "results" in r and (
-            r["results"].get("power_lines", {}).get("visible") or
-            r["results"].get("power_lines_street", {}).get("visible")
-        )
+    # Parse only the rows and columns under test with pandas' C reader;
+    # dtype=str + na_filter=False skips the NaN-inference pass entirely
+    df = pd.read_csv(
+        csv_path,
+        usecols=["Street Address", "City", "State", "Postal Code"],
+        dtype=str,
+        na_filter=False,
+        nrows=num_to_test
     )
+    properties = [
+        {"address": addr, "city": city, "state": state, "zip": zip_code}
+        for addr, city, state, zip_code in
+        df[["Street Address", "City", "State", "Postal Code"]].itertuples(index=False, name=None)
+    ]
+
+    # Drop unusable rows up front and say how many were filtered
+    before = len(properties)
+    properties = [p for p in properties if p["address"].strip() and p["zip"].strip()]
+    dropped = before - len(properties)
+    if dropped:
+        logger.info(f"Dropped {dropped} rows with blank address/zip")
+
+    # Resume support: skip addresses already analyzed by a previous run.
+    # Error records are persisted too but deliberately not counted as done,
+    # so transient geocode/imagery/AI failures are retried on rerun.
+    done = set()
+    if os.path.exists(RESULTS_PATH):
+        with open(RESULTS_PATH, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = _json_loads(line)
+                    if "results" in record:
+                        done.add(record["address"])
+                except (ValueError, KeyError):
+                    continue
+    if done:
+        before = len(properties)
+        properties = [p for p in properties if p["address"] not in done]
+        skipped = before - len(properties)
+        if skipped:
+            logger.info(f"Resuming: {skipped} properties already in {RESULTS_PATH}")
+
+    results_fh = open(RESULTS_PATH, 'a', buffering=65536, encoding='utf-8')
+    persisted = 0
+
+    def persist(result: Dict):
+        # Buffered append; flush every 10 so a crash loses at most a few rows
+        nonlocal persisted
+        results_fh.write(_json_dumps(result) + "\n")
+        persisted += 1
+        if persisted % 10 == 0:
+            results_fh.flush()
+
+    # Two-stage pipeline: while the AI model chews on one property, the next
+    # property's geocode + imagery fetch is already in flight. maxsize=2
+    # bounds read-ahead so a slow AI stage never piles up fetched imagery.
+    queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+    results_list: List[Dict] = []
+    stats = Counter()  # built as results land, so the summary needs no re-scan
+
+    def tally(result: Dict):
+        if "results" in result:
+            stats["successful"] += 1
+            res = result["results"]
+            if (res.get("power_lines", {}).get("visible") or
+                    res.get("power_lines_street", {}).get("visible")):
+                stats["power_lines"] += 1
+        else:
+            stats["failed"] += 1
+
+    async def imagery_stage():
+        for i, prop in enumerate(properties, 1):
+            logger.info(f"\n\n{'='*80}")
+            logger.info(f"PROPERTY {i}/{num_to_test}")
+            logger.info(f"{'='*80}")
+            item = await fetch_property_inputs(
+                address=prop["address"],
+                city=prop["city"],
+                state=prop["state"],
+                zip_code=prop["zip"],
+                imagery_service=imagery_service
+            )
+            if "error" in item:
+                results_list.append(item)
+                tally(item)
+                persist(item)
+                mem_handler.flush()
+            else:
+                await queue.put(item)
+        await queue.put(None)  # sentinel: no more work
+
+    async def ai_stage():
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+            result = await run_ai_analysis(item, ai_service)
+            results_list.append(result)
+            tally(result)
+            persist(result)
+            mem_handler.flush()
+
+    async def run_all() -> List[Dict]:
+        await asyncio.gather(imagery_stage(), ai_stage())
+        return results_list
+
+    results_list = asyncio.run(run_all())
+    results_fh.close()
 
-    print(f"\n🔌 Power Lines Detected: {power_lines_detected}/{successful}")
+    # Summary
+    logger.info("="*80)
+    logger.info("TESTING COMPLETE - SUMMARY")
+    logger.info("="*80)
 
-    print("\n" + "="*80 + "\n")
+    logger.info(f"Total Tested: {len(results_list)}")
+    logger.info(f"Successful: {stats['successful']}")
+    logger.info(f"Failed: {stats['failed']}")
+    logger.info(f"🔌 Power Lines Detected: {stats['power_lines']}/{stats['successful']}")
+    mem_handler.flush()
 
 
 if __name__ == "__main__":
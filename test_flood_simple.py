@@ -5,10 +5,22 @@ Simple test of flood zone detection with known Lehigh Acres coordinates
 import sys
 sys.path.append('/Users/ahmadraza/Documents/property-anyslis/backend')
 
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from functools import lru_cache
+
 from gis_service import GISRiskService
 
-# Initialize service
-gis = GISRiskService()
+
+# Singleton: rebuilding the service (and its HTTP session) on every rerun in
+# the same interpreter is wasted constructor work
+@lru_cache(maxsize=1)
+def get_gis() -> GISRiskService:
+    return GISRiskService()
+
+
+gis = get_gis()
 
 # Sample Lehigh Acres coordinates (center of Lehigh Acres)
 # These are real coordinates in different parts of Lehigh Acres, FL
@@ -28,9 +40,36 @@ test_locations = [
 print("Testing Flood Zone Detection for Lehigh Acres, FL")
 print("=" * 80)
 
-zone_counts = {}
+zone_counts = Counter()
+
+# FEMA flood zones are polygon-scale, so coordinates within ~100m (3 decimal
+# places) share a result; memoizing collapses near-duplicate lookups
+_flood_memo = {}
+
 
-for location in test_locations:
+def check_flood_zone_cached(lat, lon, city, state):
+    """Memoized flood-zone lookup keyed on coordinates rounded to ~100m."""
+    key = (round(lat, 3), round(lon, 3), city, state)
+    result = _flood_memo.get(key)
+    if result is None:
+        result = gis.check_flood_zone(lat, lon, city, state)
+        _flood_memo[key] = result
+    return result
+
+
+def fetch(location):
+    """Run one flood-zone lookup; requests releases the GIL so these overlap."""
+    return location, check_flood_zone_cached(location['lat'], location['lon'],
+                                             "Lehigh Acres", "FL")
+
+
+# Each check is a FEMA REST round-trip, so fire all of them at once and
+# report as they complete instead of paying the latencies back to back
+with ThreadPoolExecutor(max_workers=len(test_locations)) as executor:
+    futures = [executor.submit(fetch, location) for location in test_locations]
+    completed = [future.result() for future in as_completed(futures)]
+
+for location, flood_result in completed:
     name = location['name']
     lat = location['lat']
     lon = location['lon']
@@ -38,9 +77,6 @@ for location in test_locations:
     print(f"\nTesting: {name}")
     print(f"Coordinates: {lat}, {lon}")
 
-    # Check flood zone
-    flood_result = gis.check_flood_zone(lat, lon, "Lehigh Acres", "FL")
-
     print(f"   Flood Zone: {flood_result['zone']}")
     print(f"   Severity: {flood_result['severity']}")
     print(f"   Confidence: {flood_result['confidence']}")
@@ -51,13 +87,12 @@ for location in test_locations:
         print(f"   In SFHA: {flood_result['in_sfha']}")
 
     # Count zones
-    zone = flood_result['zone']
-    zone_counts[zone] = zone_counts.get(zone, 0) + 1
+    zone_counts[flood_result['zone']] += 1
 
 print("\n" + "=" * 80)
 print("SUMMARY:")
 print("-" * 80)
-for zone, count in sorted(zone_counts.items(), key=lambda x: x[1], reverse=True):
+for zone, count in zone_counts.most_common():
     percentage = (count / len(test_locations)) * 100
     print(f"{zone}: {count} locations ({percentage:.1f}%)")
 print("=" * 80)
@@ -7,69 +7,140 @@ sys.path.append('/Users/ahmadraza/Documents/property-anyslis/backend')
 
 from gis_service import GISRiskService
 from geocoding_service import GeocodingService
+import asyncio
 import csv
+from collections import Counter
+from itertools import islice
+import geocode_cache
+import test_support
+from functools import lru_cache
 
-# Initialize services
-gis = GISRiskService()
-geocoder = GeocodingService()
+
+# Service singletons: constructors build HTTP sessions, so REPL reruns and
+# cross-module imports should reuse one instance instead of rebuilding
+@lru_cache(maxsize=1)
+def get_gis() -> GISRiskService:
+    return GISRiskService()
+
+
+@lru_cache(maxsize=1)
+def get_geocoder() -> GeocodingService:
+    return GeocodingService()
+
+
+gis = get_gis()
+geocoder = get_geocoder()
+# Share the cross-script pooled session for geocoding; the GIS service keeps
+# its own session because of the legacy-SSL adapter it mounts
+geocoder.session = test_support.get_session()
 
 # Read sample addresses from CSV
 csv_file = "/Users/ahmadraza/Documents/property-anyslis/backend/Export_Contacts_Cleaned Target Best Lehigh_Dec_2025_5_41_PM.csv"
 
-print("Testing Flood Zone Detection for Lehigh Acres Properties")
-print("=" * 80)
-
-with open(csv_file, 'r') as f:
-    reader = csv.DictReader(f)
-    count = 0
-    zone_counts = {}
+# Nominatim allows ~1 request/second, so geocodes are serialized behind this
+# semaphore; flood-zone checks have no such cap and start as soon as each
+# row's geocode lands, overlapping the remaining lookups
+geocode_semaphore = asyncio.Semaphore(1)
+
+# FEMA flood zones are polygon-scale, so coordinates within ~100m (3 decimal
+# places) share a result; memoizing collapses near-duplicate lookups across
+# adjacent parcels
+_flood_memo = {}
+
+
+async def check_flood_zone_cached(lat, lon, city, state):
+    """Memoized flood-zone lookup keyed on coordinates rounded to ~100m."""
+    key = (round(lat, 3), round(lon, 3), city, state)
+    result = _flood_memo.get(key)
+    if result is None:
+        result = await asyncio.to_thread(gis.check_flood_zone, lat, lon, city, state)
+        _flood_memo[key] = result
+    return result
+
+
+async def geocode_row(address, city, state, zipcode):
+    """Geocode one row, consulting the shared on-disk cache first."""
+    cached = geocode_cache.get(address, city, state, zipcode)
+    if cached is not None:
+        return {'lat': cached[0], 'lon': cached[1]}
+
+    async with geocode_semaphore:
+        geocode_result = await asyncio.to_thread(
+            geocoder.geocode_address, address, city, state, zipcode
+        )
+    if (geocode_result and geocode_result.get('lat') is not None
+            and geocode_result.get('lon') is not None):
+        geocode_cache.put(address, city, state, zipcode,
+                          geocode_result['lat'], geocode_result['lon'])
+    return geocode_result
+
+
+async def check_row(number, address, city, state, zipcode):
+    """Geocode a row, then run its flood-zone check as soon as coords arrive."""
+    geocode_result = await geocode_row(address, city, state, zipcode)
+
+    # 0.0 is a valid coordinate, so test for None rather than truthiness
+    if (geocode_result and geocode_result.get('lat') is not None
+            and geocode_result.get('lon') is not None):
+        lat = geocode_result['lat']
+        lon = geocode_result['lon']
+        flood_result = await check_flood_zone_cached(lat, lon, city, state)
+        return (number, address, city, state, zipcode, lat, lon, flood_result)
+
+    return (number, address, city, state, zipcode, None, None, None)
+
+
+async def run_tests(rows):
+    """Dispatch all rows concurrently and report in completion order."""
+    zone_counts = Counter()
     total_tested = 0
 
-    for row in reader:
-        if count >= 10:  # Test first 10 properties
-            break
+    tasks = [
+        asyncio.create_task(check_row(i, *row))
+        for i, row in enumerate(rows, 1)
+    ]
 
-        address = row['Street address']
-        city = row['City']
-        state = row['State']
-        zipcode = row['Postal Code']
+    for task in asyncio.as_completed(tasks):
+        number, address, city, state, zipcode, lat, lon, flood_result = await task
 
-        # Geocode address
-        print(f"\n{count + 1}. Testing: {address}, {city}, {state} {zipcode}")
+        print(f"\n{number}. Testing: {address}, {city}, {state} {zipcode}")
 
-        geocode_result = geocoder.geocode_address(address, city, state, zipcode)
+        if flood_result is None:
+            print(f"   Geocoding failed")
+            continue
 
-        if geocode_result and geocode_result.get('lat') and geocode_result.get('lon'):
-            lat = geocode_result['lat']
-            lon = geocode_result['lon']
+        print(f"   Coordinates: {lat}, {lon}")
+        print(f"   Flood Zone: {flood_result['zone']}")
+        print(f"   Severity: {flood_result['severity']}")
+        print(f"   Confidence: {flood_result['confidence']}")
+        print(f"   Source: {flood_result['source']}")
+        if 'note' in flood_result:
+            print(f"   Note: {flood_result['note']}")
 
-            print(f"   Coordinates: {lat}, {lon}")
+        # Count zones
+        zone_counts[flood_result['zone']] += 1
+        total_tested += 1
 
-            # Check flood zone
-            flood_result = gis.check_flood_zone(lat, lon, city, state)
+    return zone_counts, total_tested
 
-            print(f"   Flood Zone: {flood_result['zone']}")
-            print(f"   Severity: {flood_result['severity']}")
-            print(f"   Confidence: {flood_result['confidence']}")
-            print(f"   Source: {flood_result['source']}")
-            if 'note' in flood_result:
-                print(f"   Note: {flood_result['note']}")
 
-            # Count zones
-            zone = flood_result['zone']
-            zone_counts[zone] = zone_counts.get(zone, 0) + 1
-            total_tested += 1
+print("Testing Flood Zone Detection for Lehigh Acres Properties")
+print("=" * 80)
 
-            count += 1
-        else:
-            print(f"   Geocoding failed")
-            count += 1
+with open(csv_file, 'r') as f:
+    # Test first 10 properties; islice stops reading once it has them
+    rows = [
+        (row['Street address'], row['City'], row['State'], row['Postal Code'])
+        for row in islice(csv.DictReader(f), 10)
+    ]
+
+zone_counts, total_tested = asyncio.run(run_tests(rows))
 
 print("\n" + "=" * 80)
 print("SUMMARY:")
 print("-" * 80)
 if total_tested > 0:
-    for zone, cnt in sorted(zone_counts.items(), key=lambda x: x[1], reverse=True):
+    for zone, cnt in zone_counts.most_common():
         percentage = (cnt / total_tested) * 100
         print(f"{zone}: {cnt} properties ({percentage:.1f}%)")
 else:
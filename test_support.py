@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP session for the root test scripts.
+
+Each script used to build its own requests.Session with slightly different
+pool/retry tuning, so scripts run back-to-back (or importing each other)
+never shared a connection pool. This module owns one tuned session that all
+of them reuse, and closes it at interpreter exit.
+"""
+
+import atexit
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+USER_AGENT = "PropertyAnalysisTest/1.0"
+
+
+@lru_cache(maxsize=1)
+def get_session() -> requests.Session:
+    """Process-wide pooled session with retry/backoff on transient errors."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=1.0,
+                          status_forcelist=[429, 502, 503, 504])
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"User-Agent": USER_AGENT})
+    atexit.register(session.close)
+    return session